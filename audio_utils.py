@@ -0,0 +1,188 @@
+import logging
+import re
+import shutil
+import subprocess
+import tempfile
+from typing import Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Путь к ffmpeg; None, если ffmpeg не установлен
+FFMPEG_PATH = shutil.which("ffmpeg")
+
+# Частота дискретизации, ожидаемая распознавателем
+SAMPLE_RATE = 16000
+
+# Размер блока чтения из канала ffmpeg
+_PIPE_READ_SIZE = 64 * 1024
+
+# Сколько слов на стыке двух фрагментов сравнивается при поиске дубликата:
+# примерно столько слов укладывается в перекрытие фрагментов (~2 секунды речи)
+MERGE_WINDOW_WORDS = 8
+
+# Допуск на стыке (в словах): слово, разрезанное границей фрагмента, может быть
+# распознано по-разному, поэтому совпадение может заканчиваться чуть раньше конца
+# предыдущего фрагмента либо начинаться чуть позже начала следующего
+_SEAM_SLACK_WORDS = 1
+
+_PUNCTUATION_RE = re.compile(r"[^\w]+")
+
+
+def iter_pcm16k_mono(audio_path: str,
+                     block_size: int = _PIPE_READ_SIZE,
+                     resampler: Optional[str] = None) -> Iterator[bytes]:
+    """
+    Потоковое декодирование аудиофайла в 16kHz mono 16-bit PCM через ffmpeg
+
+    Декодирование и передискретизация выполняются в ffmpeg, данные читаются
+    из канала блоками фиксированного размера: в памяти одновременно находится
+    только текущий блок, а не весь файл. Канал читается без буферизации
+    в один заранее выделенный буфер, наружу отдается копия заполненной части.
+
+    Args:
+        audio_path: Путь к аудиофайлу
+        block_size: Размер блока в байтах (четный, кратен размеру сэмпла)
+        resampler: Передискретизатор ffmpeg (например, "soxr"); None — встроенный swr
+
+    Yields:
+        bytes: Блоки сырых данных PCM (s16le); последний блок может быть короче
+
+    Raises:
+        RuntimeError: Если ffmpeg недоступен или завершился с ошибкой
+    """
+    if not FFMPEG_PATH:
+        raise RuntimeError("ffmpeg не найден в PATH")
+
+    command = [
+        FFMPEG_PATH, "-nostdin", "-loglevel", "error",
+        "-i", audio_path,
+        "-vn", "-sn", "-dn"
+    ]
+    if resampler:
+        # soxr — векторизованный полифазный передискретизатор: быстрее и точнее swr
+        # при некратных соотношениях частот (44.1 кГц -> 16 кГц)
+        command += ["-af", f"aresample=resampler={resampler}"]
+    command += [
+        "-f", "s16le", "-acodec", "pcm_s16le", "-ac", "1", "-ar", str(SAMPLE_RATE),
+        "pipe:1"
+    ]
+
+    # stderr пишется во временный файл, а не в канал: на битом файле ffmpeg выводит строку
+    # на каждый испорченный фрейм, и заполненный канал stderr заблокировал бы его вместе с нами
+    stderr_file = tempfile.TemporaryFile()
+    # bufsize=0: чтение напрямую из канала в наш буфер, без промежуточного BufferedReader
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr_file, bufsize=0)
+    buffer = memoryview(bytearray(block_size))
+    try:
+        while True:
+            # Канал отдает данные порциями, поэтому дочитываем до заполнения блока или конца потока
+            filled = 0
+            while filled < block_size:
+                read = process.stdout.readinto(buffer[filled:])
+                if not read:
+                    break
+                filled += read
+            if not filled:
+                break
+            # Сегмент обрабатывается после следующего чтения в буфер, поэтому нужна копия
+            yield bytes(buffer[:filled])
+            if filled < block_size:
+                break
+
+        if process.wait() != 0:
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode(errors='replace').strip()
+            raise RuntimeError(f"Ошибка декодирования {audio_path} через ffmpeg: {stderr}")
+    finally:
+        # Генератор могут закрыть досрочно — не оставляем ffmpeg висеть
+        if process.poll() is None:
+            process.kill()
+        process.stdout.close()
+        process.wait()
+        stderr_file.close()
+
+
+def _normalize_word(word: str) -> str:
+    """Приведение слова к виду для сравнения: без регистра и пунктуации"""
+    return _PUNCTUATION_RE.sub("", word.lower())
+
+
+def _find_seam_overlap(tail: List[str], head: List[str]) -> Optional[tuple]:
+    """
+    Поиск повтора на стыке: конец tail должен совпадать с началом head
+
+    Совпадение привязано к стыку, поэтому общие фразы в глубине фрагментов
+    (например, "и в") не считаются перекрытием.
+
+    Args:
+        tail: Нормализованные последние слова предыдущего фрагмента
+        head: Нормализованные первые слова следующего фрагмента
+
+    Returns:
+        Optional[tuple]: (начало совпадения в tail, начало совпадения в head) или None
+    """
+    # Предпочитаем самое длинное совпадение, затем самое близкое к стыку
+    for size in range(min(len(tail), len(head)), 0, -1):
+        # Одно совпавшее слово слишком часто случайно: оно должно стоять точно на стыке
+        slack = _SEAM_SLACK_WORDS if size >= 2 else 0
+        for tail_slack in range(slack + 1):
+            a = len(tail) - tail_slack - size
+            if a < 0:
+                continue
+            # Допуск общий на оба фрагмента: пропуск слов с обеих сторон стыка уже не повтор
+            for b in range(slack - tail_slack + 1):
+                if b + size <= len(head) and head[b:b + size] == tail[a:a + size]:
+                    return a, b
+    return None
+
+
+def merge_transcripts(parts: List[str], window_words: int = MERGE_WINDOW_WORDS) -> str:
+    """
+    Склейка транскрипций соседних фрагментов, записанных с перекрытием
+
+    На стыке ищется повтор: слова в конце предыдущего фрагмента, совпадающие
+    со словами в начале следующего. Если повтора нет, фрагменты просто соединяются.
+
+    Args:
+        parts: Транскрипции фрагментов в порядке следования
+        window_words: Сколько слов на стыке сравнивать (примерно слов в перекрытии)
+
+    Returns:
+        str: Общий текст без дублирования на стыках
+
+    Examples:
+        >>> merge_transcripts(['раз два три', 'три четыре пять'])
+        'раз два три четыре пять'
+        >>> merge_transcripts(['мы обсудили план на неделю и в итоге решили что',
+        ...                    'решили что нужно переделать сервис и в пятницу выпустить релиз'])
+        'мы обсудили план на неделю и в итоге решили что нужно переделать сервис и в пятницу выпустить релиз'
+        >>> merge_transcripts(['и в понедельник', 'созвонились и в среду'])
+        'и в понедельник созвонились и в среду'
+        >>> merge_transcripts(['мы решили в пятницу', 'в понедельник начнем'])
+        'мы решили в пятницу в понедельник начнем'
+        >>> merge_transcripts(['сделаем это', 'потом это обсудим'], window_words=4)
+        'сделаем это потом это обсудим'
+    """
+    merged: List[str] = []
+
+    for part in parts:
+        words = part.split()
+        if not words:
+            continue
+        if not merged:
+            merged.extend(words)
+            continue
+
+        tail = [_normalize_word(w) for w in merged[-window_words:]]
+        head = [_normalize_word(w) for w in words[:window_words]]
+        overlap = _find_seam_overlap(tail, head)
+
+        if overlap:
+            # Обрезаем предыдущий фрагмент по началу повтора и продолжаем с него же в следующем
+            a, b = overlap
+            del merged[len(merged) - len(tail) + a:]
+            merged.extend(words[b:])
+        else:
+            merged.extend(words)
+
+    return " ".join(merged)
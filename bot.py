@@ -37,56 +37,69 @@ dp = Dispatcher()
 
 wait_url = State()
 
+# Блокировка обработки: пока совещание обрабатывается в фоне, бот продолжает отвечать
+processing_lock = asyncio.Lock()
+
 # Хэндлер на команду /start
 @dp.message(F.audio | F.voice)
 async def cmd_start(message: types.Message):
     await message.answer("Получено голосовое сообщение")
-    if message.voice:
-        voice_file = await bot.get_file(message.voice.file_id)
-        await bot.download_file(voice_file.file_path, "audio.mp3")
-    elif message.audio:
+    # Файлы аудио и протокола общие, поэтому совещания обрабатываются по одному
+    async with processing_lock:
+        if message.voice:
+            voice_file = await bot.get_file(message.voice.file_id)
+            await bot.download_file(voice_file.file_path, "audio.mp3")
+        elif message.audio:
+            try:
+                audio_file = await bot.get_file(message.audio.file_id)
+                await bot.download_file(audio_file.file_path, "audio.mp3")
+            except:
+                builder = InlineKeyboardBuilder()
+                builder.add(types.InlineKeyboardButton(
+                    text="Отправить ссылку",
+                    callback_data="wait_url")
+                )
+                await message.answer("Файл слишком большой, допускаются файлы размером менее 20МБ, попробуйте сжать его или отправьте ссылку на файл на Яндекс диске", reply_markup=builder.as_markup())
+                return
         try:
-            audio_file = await bot.get_file(message.audio.file_id)
-            await bot.download_file(audio_file.file_path, "audio.mp3")
-        except:
-            builder = InlineKeyboardBuilder()
-            builder.add(types.InlineKeyboardButton(
-                text="Отправить ссылку",
-                callback_data="wait_url")
-            )
-            await message.answer("Файл слишком большой, допускаются файлы размером менее 20МБ, попробуйте сжать его или отправьте ссылку на файл на Яндекс диске", reply_markup=builder.as_markup())
-            return
-    try:
-        processing_time = secretary.process_meeting_audio("audio.mp3")
-        await message.answer(f"Обработка завершена, затраченное время: {processing_time}")
-        protocol = FSInputFile("Протокол_совещания.docx")
-        await message.answer_document(protocol)
-    except Exception as e:
-        await message.answer(f"Произошла ошибка: {e}")
+            # Обработка выполняется в отдельном потоке, чтобы не блокировать цикл событий бота
+            processing_time = await asyncio.to_thread(secretary.process_meeting_audio, "audio.mp3")
+            await message.answer(f"Обработка завершена, затраченное время: {processing_time}")
+            protocol = FSInputFile("Протокол_совещания.docx")
+            await message.answer_document(protocol)
+        except Exception as e:
+            await message.answer(f"Произошла ошибка: {e}")
     # transcribed_audio = openai_tr.transcribe_from_file("audio.mp3")
     # analyzed_text = openai_an.analyze_transcript(transcribed_audio)
     # weeek_int.create_tasks_from_analysis(analyzed_text)
 
+def download_from_yandex_disk(public_url: str, path: str) -> None:
+    """Скачивание файла по публичной ссылке Яндекс Диска (блокирующий вызов)"""
+    base_url = 'https://cloud-api.yandex.net/v1/disk/public/resources/download?'
+    final_url = base_url + urlencode(dict(public_key=public_url))
+    response = requests.get(final_url)
+    download_url = response.json()['href']
+    download_response = requests.get(download_url)
+    with open(path, 'wb') as f:
+        f.write(download_response.content)
+
+
 @dp.message(wait_url)
 async def get_url(message: types.Message):
     try:
-        base_url = 'https://cloud-api.yandex.net/v1/disk/public/resources/download?'
-        url = message.text
-        final_url = base_url + urlencode(dict(public_key=url))
-        response = requests.get(final_url)
-        download_url = response.json()['href']
-        await message.answer("Началась загрузка")
-        download_response = requests.get(download_url)
-        with open('downloaded_audio.mp3', 'wb') as f:
-            f.write(download_response.content)
-        await message.answer("Загрузка завершена, началась обработка")
-        try:
-            processing_time = secretary.process_meeting_audio("downloaded_audio.mp3")
-            await message.answer(f"Обработка завершена, затраченное время: {processing_time} секунд")
-            protocol = FSInputFile("Протокол_совещания.docx")
-            await message.answer_document(protocol)
-        except Exception as e:
-            await message.answer(f"Произошла ошибка: {e}")
+        # Файл загрузки общий, поэтому и скачивание, и обработка выполняются под блокировкой;
+        # сетевые запросы идут в отдельном потоке, чтобы не блокировать цикл событий бота
+        async with processing_lock:
+            await message.answer("Началась загрузка")
+            await asyncio.to_thread(download_from_yandex_disk, message.text, 'downloaded_audio.mp3')
+            await message.answer("Загрузка завершена, началась обработка")
+            try:
+                processing_time = await asyncio.to_thread(secretary.process_meeting_audio, "downloaded_audio.mp3")
+                await message.answer(f"Обработка завершена, затраченное время: {processing_time} секунд")
+                protocol = FSInputFile("Протокол_совещания.docx")
+                await message.answer_document(protocol)
+            except Exception as e:
+                await message.answer(f"Произошла ошибка: {e}")
     except:
         await message.answer("Что-то пошло не так")
 
@@ -9,7 +9,13 @@ load_dotenv()
 class VoskConfig:
     """Конфигурация для Vosk"""
     model_path: str
+    # Длина независимого сегмента, мс. Сегмент целиком передается в распознаватель одним вызовом:
+    # длиннее сегмент — меньше накладных расходов и стыков, короче — равномернее загрузка потоков
     chunk_size: int = 45000  # 45 секунд
+    workers: Optional[int] = None  # Число параллельных сегментов (по умолчанию — число ядер)
+    use_batch: bool = False  # Пакетное распознавание на GPU (BatchModel, нужна GPU-сборка vosk)
+    silence_threshold_dbfs: Optional[float] = -50.0  # Сегменты, где каждые 100 мс тише порога, не распознаются (None — распознавать все)
+    resampler: Optional[str] = None  # Передискретизатор ffmpeg: "soxr" (нужна сборка с libsoxr) или None — встроенный swr
 
 
 @dataclass
@@ -19,6 +25,11 @@ class OpenAIConfig:
     analyze_model: str = "gpt-4.1-mini"
     transcript_model: str = "whisper-1"
     temperature: float = 0.3
+    max_retries: int = 5  # Повторы SDK при 429/5xx (экспоненциальная задержка с джиттером)
+    timeout: float = 1800.0  # Таймаут запроса в секундах (загрузка длинных записей)
+    max_concurrent_requests: int = 8  # Одновременные запросы анализа (под лимит RPM аккаунта)
+    cache_dir: Optional[str] = ".openai_cache"  # Кэш результатов анализа (None — отключен)
+    map_reduce_threshold: int = 40000  # Длина транскрипции (символы), начиная с которой анализ идет по фрагментам
 
 
 @dataclass
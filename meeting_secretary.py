@@ -1,5 +1,6 @@
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from pathlib import Path
@@ -8,7 +9,7 @@ from create_protocol import replace_placeholders
 from config import MeetingSecretaryConfig, VoskConfig, OpenAIConfig, WeeekConfig
 from vosk_transcriber import VoskTranscriber
 from openai_analyzer import OpenAIAnalyzer, MeetingAnalysis
-from openai_transcriber1 import OpenAITranscriber
+from openai_transcriber import OpenAITranscriber
 from weeek_integration import WeeekIntegration
 
 # Настройка логирования
@@ -77,11 +78,13 @@ class TechnicalMeetingSecretary:
             if not self.analyzer.validate_analysis(analysis):
                 logger.warning("Анализ содержит ошибки, но продолжаем")
 
-            # 3. Интеграция с Weeek
-            self.weeek_integration.create_tasks_from_analysis(analysis)
-
-            # 4. Заполнение протокола
-            replace_placeholders("Протокол_совещания.docx", analysis)
+            # 3. Интеграция с Weeek и 4. заполнение протокола не зависят друг от друга:
+            # сетевые запросы к Weeek выполняются одновременно с генерацией документа
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                weeek_future = executor.submit(self.weeek_integration.create_tasks_from_analysis, analysis, start_time)
+                protocol_future = executor.submit(replace_placeholders, "Протокол_совещания.docx", analysis)
+                weeek_future.result()
+                protocol_future.result()
             # 4. Формирование результата
             processing_time = (datetime.now() - start_time).total_seconds()
             logger.info(f"=== ОБРАБОТКА ЗАВЕРШЕНА УСПЕШНО ЗА {processing_time:.2f} СЕКУНД ===")
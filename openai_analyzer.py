@@ -1,18 +1,268 @@
+import asyncio
 import datetime
+import hashlib
 import json
 import logging
+import os
 from dataclasses import dataclass
-from typing import Dict, List, Any
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
 
 from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.shared import Inches, Pt
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from config import OpenAIConfig
 
 logger = logging.getLogger(__name__)
 
+# Формат ответа (structured outputs): модель гарантированно возвращает JSON по схеме.
+# В строгом режиме все поля объектов обязательны, а дополнительные поля запрещены.
+MEETING_ANALYSIS_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "analyze_technical_meeting",
+        "description": "Анализирует транскрипцию технического совещания и извлекает структурированную информацию",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "additionalProperties": False,
+            "properties": {
+                "summary": {
+                    "type": "string",
+                    "description": "Краткое резюме совещания в 2-3 предложениях"
+                },
+                "tasks": {
+                    "type": "array",
+                    "description": "Список выявленных задач с полной информацией",
+                    "items": {
+                        "type": "object",
+                        "additionalProperties": False,
+                        "properties": {
+                            "название": {
+                                "type": "string",
+                                "description": "Название задачи (краткое и емкое)"
+                            },
+                            "описание": {
+                                "type": "string",
+                                "description": "Подробное описание задачи с техническими деталями"
+                            },
+                            "суть_задачи": {
+                                "type": "string",
+                                "description": "Краткая суть задачи в 1-2 предложениях, основная цель"
+                            },
+                            "кто_выполняет": {
+                                "type": "string",
+                                "description": "Ответственный за выполнение (имя, должность или отдел)"
+                            },
+                            "срок": {
+                                "type": "string",
+                                "description": "Срок выполнения в формате YYYY-MM-DD, в текстовом формате (завтра/послезавтра/через неделю/через две недели/через меняц) или строка Не указан, если в совещании не обговаривалось"
+                            }
+                        },
+                        "required": ["название", "описание", "суть_задачи", "кто_выполняет", "срок"]
+                    }
+                },
+                "hypotheses": {
+                    "type": "array",
+                    "description": "Список гипотез, требующих проверки",
+                    "items": {
+                        "type": "object",
+                        "additionalProperties": False,
+                        "properties": {
+                            "hypothesis": {
+                                "type": "string",
+                                "description": "Описание гипотезы"
+                            },
+                            "status": {
+                                "type": "string",
+                                "enum": ["требует проверки", "принята", "отклонена"],
+                                "description": "Статус гипотезы"
+                            },
+                            "related_area": {
+                                "type": "string",
+                                "description": "Связанная техническая область"
+                            }
+                        },
+                        "required": ["hypothesis", "status", "related_area"]
+                    }
+                },
+                "decisions": {
+                    "type": "array",
+                    "description": "Список принятых решений",
+                    "items": {
+                        "type": "string",
+                        "description": "Описание принятого решения"
+                    }
+                },
+                "participants": {
+                    "type": "array",
+                    "description": "Список участников совещания",
+                    "items": {
+                        "type": "string",
+                        "description": "Фамилия и инициалы участника"
+                    }
+                },
+                "president": {
+                    "type": "string",
+                    "description": "Фамилия и инициалы председателя совещания"
+                },
+                "secretary": {
+                    "type": "string",
+                    "description": "Фамилия и инициалы секретаря совещания"
+                },
+                "absent": {
+                    "type": "array",
+                    "description": "Список отсутствовавших на совещании",
+                    "items": {
+                        "type": "string",
+                        "description": "Фамилия и инициалы отсутствовавшего"
+                    }
+                }
+
+            },
+            "required": ["summary", "tasks", "hypotheses", "decisions", "participants", "president", "secretary", "absent"]
+        }
+    }
+}
+
+# Системный промпт анализатора
+_SYSTEM_PROMPT = (
+    "Ты эксперт по анализу технических совещаний на предприятиях. "
+    "Ты специализируешься на выделении задач, гипотез и решений из "
+    "технических дискуссий инженеров разных специальностей. "
+    "Для транскрипции совещания использовалась модель, поддерживающая"
+    "только русские слова, поэтому могут возникнуть ошибки, англоицизмы или технические"
+    "термины могут быть переведены в текст, как созвучные слова,"
+    "Обрати на это внимание."
+    "Для каждой задачи ты ОБЯЗАТЕЛЬНО заполняешь все поля."
+    "ЕСЛИ НЕ ХВАТАЕТ ИНФОРМАЦИИ ЗАПОЛНЯЙ ПОЛЕ КАК \"Не указан\""
+    "НЕ ДОПОЛНЯЙ ПОЛЯ ОТ СЕБЯ, ИСПОЛЬЗУЙ ТОЛЬКО ИНФОРМАЦИЮ С СОВЕЩАНИЙ"
+)
+
+# Шаблон пользовательского промпта; транскрипция подставляется при каждом вызове
+_ANALYSIS_PROMPT_TEMPLATE = """
+        Проанализируй транскрипцию технического совещания на предприятии.
+        НЕ ДОБАВЛЯЙ НИЧЕГО ОТ СЕБЯ, ИСПОЛЬЗУЙ ТОЛЬКО ИНФОРМАЦИЮ С СОВЕЩАНИЯ, ЕСЛИ НА СОВЕЩАНИИ НЕ ХВАТИЛО ИНФОРМАЦИИ
+        О ЧЕМ-ЛИБО ПОМЕЧАЙ КАК \"Не указано\"
+
+        Для каждой задачи обязательно заполни все основные поля:
+        - название: краткое название задачи
+        - описание: подробное техническое описание
+        - суть_задачи: краткая суть в 1-2 предложениях
+        - кто_выполняет: конкретный исполнитель (если не указан, то пиши \"Не указан\")
+        - срок: конкретная дата или период выполнения (если не указан, то пиши \"Не указан\")
+
+        Обрати особое внимание на:
+        - Технические решения и их обоснование
+        - Проблемы, которые нужно решить
+        - Распределение ответственности между участниками
+        - Временные рамки выполнения задач
+
+        Транскрипция совещания:
+        {transcript}
+        """
+
+
+# Шаблон промпта для объединения результатов анализа фрагментов длинного совещания
+_REDUCE_PROMPT_TEMPLATE = """
+        Ниже приведены результаты анализа последовательных фрагментов транскрипции ОДНОГО
+        технического совещания. Объедини их в единый анализ совещания:
+        - составь общее резюме совещания в 2-3 предложениях
+        - объедини повторяющиеся задачи, гипотезы и решения, ничего не теряя
+        - НЕ ДОБАВЛЯЙ НИЧЕГО ОТ СЕБЯ, ИСПОЛЬЗУЙ ТОЛЬКО ПРИВЕДЕННЫЕ ДАННЫЕ
+
+        Результаты анализа фрагментов:
+        {partials}
+        """
+
+# Параметры нарезки длинных транскрипций для анализа по фрагментам
+_MAP_WINDOW_CHARS = 12000  # ~3000 токенов
+_MAP_OVERLAP_CHARS = 500  # Перекрытие, чтобы не разрывать высказывания на стыке
+_DUPLICATE_TITLE_RATIO = 0.85  # Порог схожести названий задач-дубликатов
+
+
+def _split_transcript(transcript: str) -> List[str]:
+    """
+    Нарезка длинной транскрипции на перекрывающиеся окна по границам слов
+
+    Args:
+        transcript: Текст транскрипции
+
+    Returns:
+        List[str]: Фрагменты транскрипции в порядке следования
+    """
+    windows = []
+    start = 0
+    length = len(transcript)
+
+    while start < length:
+        end = min(start + _MAP_WINDOW_CHARS, length)
+        if end < length:
+            space = transcript.rfind(" ", start, end)
+            if space > start:
+                end = space
+        windows.append(transcript[start:end])
+        if end >= length:
+            break
+
+        # Следующее окно начинается с границы слова внутри перекрытия
+        space = transcript.find(" ", max(start + 1, end - _MAP_OVERLAP_CHARS), end)
+        start = space + 1 if space != -1 else end
+
+    return windows
+
+
+def _merge_partial_analyses(partials: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Объединение результатов анализа фрагментов с удалением повторов
+
+    Args:
+        partials: Данные анализа каждого фрагмента
+
+    Returns:
+        Dict: Объединенные данные анализа
+    """
+    merged = {
+        "summary": " ".join(p["summary"] for p in partials if p.get("summary")),
+        "tasks": [],
+        "hypotheses": [],
+        "decisions": [],
+        "participants": [],
+        "president": "",
+        "secretary": "",
+        "absent": []
+    }
+    task_titles = []
+    seen = {"hypotheses": set(), "decisions": set(), "participants": set(), "absent": set()}
+
+    for partial in partials:
+        # Задачи из перекрывающихся фрагментов сравниваются по схожести названий
+        for task in partial.get("tasks", []):
+            title = task.get("название", "").lower()
+            if any(SequenceMatcher(None, title, known).ratio() >= _DUPLICATE_TITLE_RATIO
+                   for known in task_titles):
+                continue
+            task_titles.append(title)
+            merged["tasks"].append(task)
+
+        for key in seen:
+            for item in partial.get(key, []):
+                marker = (item.get("hypothesis", "") if isinstance(item, dict) else item).lower()
+                if marker not in seen[key]:
+                    seen[key].add(marker)
+                    merged[key].append(item)
+
+        for key in ("president", "secretary"):
+            value = partial.get(key, "")
+            if not merged[key] and value and value != "Не указан":
+                merged[key] = value
+
+    return merged
+
+
 @dataclass
 class MeetingAnalysis:
     """Структура для анализа технического совещания"""
@@ -37,112 +287,14 @@ class OpenAIAnalyzer:
             config: Конфигурация OpenAI
         """
         self.config = config
-        self.client = OpenAI(api_key=config.api_key)
-
-        # Определение схемы для tool calling
-        self.meeting_analysis_tool = {
-            "type": "function",
-            "function": {
-                "name": "analyze_technical_meeting",
-                "description": "Анализирует транскрипцию технического совещания и извлекает структурированную информацию",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "summary": {
-                            "type": "string",
-                            "description": "Краткое резюме совещания в 2-3 предложениях"
-                        },
-                        "tasks": {
-                            "type": "array",
-                            "description": "Список выявленных задач с полной информацией",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "название": {
-                                        "type": "string",
-                                        "description": "Название задачи (краткое и емкое)"
-                                    },
-                                    "описание": {
-                                        "type": "string",
-                                        "description": "Подробное описание задачи с техническими деталями"
-                                    },
-                                    "суть_задачи": {
-                                        "type": "string",
-                                        "description": "Краткая суть задачи в 1-2 предложениях, основная цель"
-                                    },
-                                    "кто_выполняет": {
-                                        "type": "string",
-                                        "description": "Ответственный за выполнение (имя, должность или отдел)"
-                                    },
-                                    "срок": {
-                                        "type": "string",
-                                        "description": "Срок выполнения в формате YYYY-MM-DD, в текстовом формате (завтра/послезавтра/через неделю/через две недели/через меняц) или строка Не указан, если в совещании не обговаривалось"
-                                    }
-                                },
-                                "required": ["название", "описание", "суть_задачи", "кто_выполняет", "срок"]
-                            }
-                        },
-                        "hypotheses": {
-                            "type": "array",
-                            "description": "Список гипотез, требующих проверки",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "hypothesis": {
-                                        "type": "string",
-                                        "description": "Описание гипотезы"
-                                    },
-                                    "status": {
-                                        "type": "string",
-                                        "enum": ["требует проверки", "принята", "отклонена"],
-                                        "description": "Статус гипотезы"
-                                    },
-                                    "related_area": {
-                                        "type": "string",
-                                        "description": "Связанная техническая область"
-                                    }
-                                },
-                                "required": ["hypothesis", "status"]
-                            }
-                        },
-                        "decisions": {
-                            "type": "array",
-                            "description": "Список принятых решений",
-                            "items": {
-                                "type": "string",
-                                "description": "Описание принятого решения"
-                            }
-                        },
-                        "participants": {
-                            "type": "array",
-                            "description": "Список участников совещания",
-                            "items": {
-                                "type": "string",
-                                "description": "Фамилия и инициалы участника"
-                            }
-                        },
-                        "president": {
-                            "type": "string",
-                            "description": "Фамилия и инициалы председателя совещания"
-                        },
-                        "secretary": {
-                            "type": "string",
-                            "description": "Фамилия и инициалы секретаря совещания"
-                        },
-                        "absent": {
-                            "type": "array",
-                            "description": "Список отсутствовавших на совещании",
-                            "items": {
-                                "type": "string",
-                                "description": "Фамилия и инициалы отсутствовавшего"
-                            }
-                        }
+        # Клиент повторяет запросы при 429/5xx с экспоненциальной задержкой и учетом retry-after
+        self.client = OpenAI(api_key=config.api_key, max_retries=config.max_retries)
 
-                    },
-                    "required": ["summary", "tasks", "hypotheses", "decisions", "participants", "president", "secretary", "absent"]
-                }
-            }
-        }
+        # Кэш результатов анализа: ключ зависит от модели, промптов и схемы,
+        # поэтому при их изменении старые записи перестают использоваться
+        self.cache_dir = Path(config.cache_dir) if config.cache_dir else None
+        self._cache_salt = json.dumps(self._build_request(""), ensure_ascii=False, sort_keys=True) \
+            + _REDUCE_PROMPT_TEMPLATE + str(config.map_reduce_threshold)
 
     def create_analysis_prompt(self, transcript: str) -> str:
         """
@@ -154,31 +306,11 @@ class OpenAIAnalyzer:
         Returns:
             str: Промпт для анализа
         """
-        return f"""
-        Проанализируй транскрипцию технического совещания на предприятии.
-        НЕ ДОБАВЛЯЙ НИЧЕГО ОТ СЕБЯ, ИСПОЛЬЗУЙ ТОЛЬКО ИНФОРМАЦИЮ С СОВЕЩАНИЯ, ЕСЛИ НА СОВЕЩАНИИ НЕ ХВАТИЛО ИНФОРМАЦИИ
-        О ЧЕМ-ЛИБО ПОМЕЧАЙ КАК \"Не указано\"
-
-        Для каждой задачи обязательно заполни все основные поля:
-        - название: краткое название задачи
-        - описание: подробное техническое описание
-        - суть_задачи: краткая суть в 1-2 предложениях
-        - кто_выполняет: конкретный исполнитель (если не указан, то пиши \"Не указан\")
-        - срок: конкретная дата или период выполнения (если не указан, то пиши \"Не указан\")
-
-        Обрати особое внимание на:
-        - Технические решения и их обоснование
-        - Проблемы, которые нужно решить
-        - Распределение ответственности между участниками
-        - Временные рамки выполнения задач
-
-        Транскрипция совещания:
-        {transcript}
-        """
+        return _ANALYSIS_PROMPT_TEMPLATE.format(transcript=transcript)
 
-    def parse_tool_response(self, response) -> Dict[str, Any]:
+    def parse_response(self, response) -> Dict[str, Any]:
         """
-        Парсинг ответа от tool calling
+        Парсинг структурированного ответа модели
 
         Args:
             response: Ответ от OpenAI
@@ -186,12 +318,11 @@ class OpenAIAnalyzer:
         Returns:
             Dict: Распарсенные данные
         """
-        try:
-            tool_call = response.choices[0].message.tool_calls[0]
-            return json.loads(tool_call.function.arguments)
-        except (IndexError, KeyError, json.JSONDecodeError) as e:
-            logger.error(f"Ошибка парсинга ответа tool calling: {e}")
-            raise
+        message = response.choices[0].message
+        if message.refusal:
+            raise ValueError(f"Модель отказалась анализировать транскрипцию: {message.refusal}")
+        # Строгая схема гарантирует корректный JSON, поэтому ответ разбирается без дополнительных проверок
+        return json.loads(message.content)
 
     def analyze_transcript(self, transcript: str) -> MeetingAnalysis:
         """
@@ -209,55 +340,249 @@ class OpenAIAnalyzer:
             logger.warning("Пустая транскрипция для анализа")
             return self._create_empty_analysis(transcript)
 
+        cached = self._load_cached(transcript)
+        if cached is not None:
+            return self._build_analysis(transcript, cached)
+
         try:
-            analysis_prompt = self.create_analysis_prompt(transcript)
-
-            response = self.client.chat.completions.create(
-                model=self.config.analyze_model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "Ты эксперт по анализу технических совещаний на предприятиях. "
-                                   "Ты специализируешься на выделении задач, гипотез и решений из "
-                                   "технических дискуссий инженеров разных специальностей. "
-                                   "Для транскрипции совещания использовалась модель, поддерживающая"
-                                   "только русские слова, поэтому могут возникнуть ошибки, англоицизмы или технические"
-                                   "термины могут быть переведены в текст, как созвучные слова,"
-                                   "Обрати на это внимание."
-                                   "Для каждой задачи ты ОБЯЗАТЕЛЬНО заполняешь все поля."
-                                   "ЕСЛИ НЕ ХВАТАЕТ ИНФОРМАЦИИ ЗАПОЛНЯЙ ПОЛЕ КАК \"Не указан\""
-                                   "НЕ ДОПОЛНЯЙ ПОЛЯ ОТ СЕБЯ, ИСПОЛЬЗУЙ ТОЛЬКО ИНФОРМАЦИЮ С СОВЕЩАНИЙ"
-                    },
-                    {
-                        "role": "user",
-                        "content": analysis_prompt
-                    }
-                ],
-                tools=[self.meeting_analysis_tool],
-                tool_choice={"type": "function", "function": {"name": "analyze_technical_meeting"}},
-                temperature=self.config.temperature
-            )
+            if len(transcript) > self.config.map_reduce_threshold:
+                analysis_data, complete = asyncio.run(self._map_reduce_standalone(transcript))
+            else:
+                response = self.client.chat.completions.create(**self._build_request(transcript))
+                analysis_data, complete = self.parse_response(response), True
+            # Локальное объединение без итогового запроса не кэшируем: при следующем вызове
+            # полный анализ будет выполнен заново
+            if complete:
+                self._store_cached(transcript, analysis_data)
+            return self._build_analysis(transcript, analysis_data)
 
-            analysis_data = self.parse_tool_response(response)
+        except Exception as e:
+            logger.error(f"Ошибка при анализе с OpenAI: {e}")
+            return self._create_empty_analysis(transcript, str(e))
 
-            logger.info(f"Анализ завершен. Найдено задач: {len(analysis_data.get('tasks', []))}")
+    async def _map_reduce_standalone(self, transcript: str) -> Tuple[Dict[str, Any], bool]:
+        """Анализ длинной транскрипции по фрагментам с собственным асинхронным клиентом"""
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_requests)
+        async with AsyncOpenAI(api_key=self.config.api_key, max_retries=self.config.max_retries) as client:
+            return await self._map_reduce(client, semaphore, transcript)
 
-            return MeetingAnalysis(
-                transcript=transcript,
-                summary=analysis_data.get("summary", ""),
-                tasks=analysis_data.get("tasks", []),
-                hypotheses=analysis_data.get("hypotheses", []),
-                decisions=analysis_data.get("decisions", []),
-                participants=analysis_data.get("participants", []),
-                president=analysis_data.get("president", ""),
-                secretary=analysis_data.get("secretary", ""),
-                absent=analysis_data.get("absent", [])
-            )
+    async def _map_reduce(self,
+                          client: AsyncOpenAI,
+                          semaphore: asyncio.Semaphore,
+                          transcript: str) -> Tuple[Dict[str, Any], bool]:
+        """
+        Анализ длинной транскрипции по фрагментам
+
+        Фрагменты анализируются параллельно, их результаты объединяются,
+        после чего одним запросом формируется общее резюме и убираются повторы.
+
+        Args:
+            client: Асинхронный клиент OpenAI
+            semaphore: Ограничитель одновременных запросов
+            transcript: Текст транскрипции
+
+        Returns:
+            Tuple[Dict, bool]: Данные анализа в формате схемы ответа и признак полного анализа
+                               (False — итоговый запрос не удался, результат объединен локально)
+        """
+        windows = _split_transcript(transcript)
+        logger.info(f"Длинная транскрипция: анализ по {len(windows)} фрагментам")
+
+        async def analyze_window(window: str) -> Dict[str, Any]:
+            async with semaphore:
+                response = await client.chat.completions.create(**self._build_request(window))
+            return self.parse_response(response)
+
+        partials = await asyncio.gather(*(analyze_window(window) for window in windows))
+        merged = _merge_partial_analyses(partials)
+
+        try:
+            reduce_prompt = _REDUCE_PROMPT_TEMPLATE.format(partials=json.dumps(merged, ensure_ascii=False))
+            async with semaphore:
+                response = await client.chat.completions.create(**self._request_kwargs(reduce_prompt))
+            return self.parse_response(response), True
+        except Exception as e:
+            logger.warning(f"Не удалось объединить анализ фрагментов моделью, используется локальное объединение: {e}")
+            return merged, False
+
+    async def _analyze_transcript_async(self,
+                                        client: AsyncOpenAI,
+                                        semaphore: asyncio.Semaphore,
+                                        transcript: str) -> MeetingAnalysis:
+        """
+        Асинхронный анализ одной транскрипции с ограничением числа одновременных запросов
+
+        Args:
+            client: Асинхронный клиент OpenAI
+            semaphore: Ограничитель одновременных запросов
+            transcript: Текст транскрипции
+
+        Returns:
+            MeetingAnalysis: Структурированный анализ
+        """
+        if not transcript.strip():
+            logger.warning("Пустая транскрипция для анализа")
+            return self._create_empty_analysis(transcript)
+
+        cached = self._load_cached(transcript)
+        if cached is not None:
+            return self._build_analysis(transcript, cached)
+
+        try:
+            if len(transcript) > self.config.map_reduce_threshold:
+                analysis_data, complete = await self._map_reduce(client, semaphore, transcript)
+            else:
+                async with semaphore:
+                    response = await client.chat.completions.create(**self._build_request(transcript))
+                analysis_data, complete = self.parse_response(response), True
+            if complete:
+                self._store_cached(transcript, analysis_data)
+            return self._build_analysis(transcript, analysis_data)
 
         except Exception as e:
             logger.error(f"Ошибка при анализе с OpenAI: {e}")
             return self._create_empty_analysis(transcript, str(e))
 
+    async def _analyze_many(self, transcripts: List[str]) -> List[MeetingAnalysis]:
+        """Параллельный анализ нескольких транскрипций в одном цикле событий"""
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_requests)
+        async with AsyncOpenAI(api_key=self.config.api_key, max_retries=self.config.max_retries) as client:
+            return await asyncio.gather(
+                *(self._analyze_transcript_async(client, semaphore, t) for t in transcripts)
+            )
+
+    def analyze_transcripts(self, transcripts: List[str]) -> List[MeetingAnalysis]:
+        """
+        Анализ нескольких совещаний с параллельными запросами к OpenAI
+
+        Запросы выполняются одновременно (не более max_concurrent_requests),
+        поэтому сетевые задержки отдельных совещаний перекрываются.
+
+        Args:
+            transcripts: Тексты транскрипций
+
+        Returns:
+            List[MeetingAnalysis]: Анализы в порядке входных транскрипций
+        """
+        logger.info(f"Начало анализа {len(transcripts)} транскрипций с OpenAI...")
+        return asyncio.run(self._analyze_many(transcripts))
+
+    def _cache_path(self, transcript: str) -> Optional[Path]:
+        """Путь к записи кэша для транскрипции или None, если кэш отключен"""
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.blake2b(self._cache_salt.encode(), digest_size=16)
+        digest.update(transcript.encode())
+        return self.cache_dir / f"{digest.hexdigest()}.json"
+
+    def _load_cached(self, transcript: str) -> Optional[Dict[str, Any]]:
+        """
+        Получение сохраненного результата анализа
+
+        Args:
+            transcript: Текст транскрипции
+
+        Returns:
+            Optional[Dict]: Данные анализа или None, если записи нет
+        """
+        path = self._cache_path(transcript)
+        if path is None or not path.exists():
+            return None
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                analysis_data = json.load(f)
+            logger.info(f"Анализ взят из кэша: {path.name}")
+            return analysis_data
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Не удалось прочитать кэш анализа {path}: {e}")
+            return None
+
+    def _store_cached(self, transcript: str, analysis_data: Dict[str, Any]) -> None:
+        """
+        Сохранение результата анализа в кэш
+
+        Args:
+            transcript: Текст транскрипции
+            analysis_data: Распарсенный ответ модели
+        """
+        path = self._cache_path(transcript)
+        if path is None:
+            return
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Запись через временный файл, чтобы параллельные запросы не видели частичный JSON
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(analysis_data, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Не удалось сохранить кэш анализа {path}: {e}")
+
+    def _build_request(self, transcript: str) -> Dict[str, Any]:
+        """
+        Формирование параметров запроса к OpenAI для анализа транскрипции
+
+        Args:
+            transcript: Текст транскрипции
+
+        Returns:
+            Dict: Аргументы для chat.completions.create
+        """
+        return self._request_kwargs(self.create_analysis_prompt(transcript))
+
+    def _request_kwargs(self, user_content: str) -> Dict[str, Any]:
+        """
+        Формирование параметров запроса к OpenAI
+
+        Args:
+            user_content: Текст пользовательского сообщения
+
+        Returns:
+            Dict: Аргументы для chat.completions.create
+        """
+        return {
+            "model": self.config.analyze_model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": _SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": user_content
+                }
+            ],
+            "response_format": MEETING_ANALYSIS_FORMAT,
+            "temperature": self.config.temperature
+        }
+
+    def _build_analysis(self, transcript: str, analysis_data: Dict[str, Any]) -> MeetingAnalysis:
+        """
+        Формирование структуры анализа из ответа модели
+
+        Args:
+            transcript: Текст транскрипции
+            analysis_data: Распарсенный ответ модели
+
+        Returns:
+            MeetingAnalysis: Структурированный анализ
+        """
+        logger.info(f"Анализ завершен. Найдено задач: {len(analysis_data.get('tasks', []))}")
+
+        return MeetingAnalysis(
+            transcript=transcript,
+            summary=analysis_data.get("summary", ""),
+            tasks=analysis_data.get("tasks", []),
+            hypotheses=analysis_data.get("hypotheses", []),
+            decisions=analysis_data.get("decisions", []),
+            participants=analysis_data.get("participants", []),
+            president=analysis_data.get("president", ""),
+            secretary=analysis_data.get("secretary", ""),
+            absent=analysis_data.get("absent", [])
+        )
+
     def _create_empty_analysis(self, transcript: str, error_message: str = "") -> MeetingAnalysis:
         """
         Создание пустого анализа в случае ошибки
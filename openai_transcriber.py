@@ -1,13 +1,47 @@
+import audioop
+import functools
 import logging
-from typing import Optional
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from audio_utils import merge_transcripts
 from config import OpenAIConfig
 
-import dotenv
+import httpx
+from pydub import AudioSegment
+from pydub.utils import db_to_float
 # Импортируем OpenAI клиент
 from openai import OpenAI, APIStatusError, AuthenticationError, OpenAIError
-dotenv.load_dotenv()
+
 logger = logging.getLogger(__name__)
 
+# Подсказка для Whisper: задаёт контекст и стиль совещания
+_MEETING_PROMPT = (
+    "Представлено совещание о сроках выполнения, задачах и выполняющих в научно-деловом стиле. "
+    "В данном совещании обрати особое внимание на диалоги между собеседниками, в диалогах указывай, "
+    "кто говорит, если собеседники представляются."
+)
+
+# Размер буфера чтения аудиофайла: крупные последовательные чтения вместо 8 КиБ по умолчанию
+_READ_BUFFER_SIZE = 1 << 20
+
+# Ограничение Whisper API на размер загружаемого файла
+_WHISPER_MAX_FILE_SIZE = 25 * 1024 * 1024
+
+# Параметры вырезания пауз
+_SILENCE_WINDOW_MS = 100  # Окно оценки громкости
+_SILENCE_MIN_LEN_MS = 1000  # Паузы короче не вырезаются
+_SILENCE_PADDING_MS = 200  # Запас вокруг речи, чтобы не обрезать края слов
+_SILENCE_THRESH_DB = -16  # Порог тишины относительно средней громкости записи
+
+# Параметры нарезки длинных записей
+_CHUNK_LENGTH_MS = 10 * 60 * 1000  # ~10 минут: при 64 кбит/с фрагмент заметно меньше 25 МБ
+_CHUNK_OVERLAP_MS = 2000  # Перекрытие, чтобы не терять слова на стыках
+_MAX_PARALLEL_UPLOADS = 5
+
+
 class OpenAITranscriber:
     """Класс для транскрипции аудио с помощью OpenAI Whisper API"""
 
@@ -22,7 +56,21 @@ class OpenAITranscriber:
         logger.info(f"Инициализация OpenAI транскрибера с моделью: {config.transcript_model}")
 
         try:
-            self.client = OpenAI(api_key=config.api_key)
+            # Клиент сам повторяет запросы при 429/5xx и сетевых сбоях,
+            # поэтому временные ошибки не требуют повторной загрузки файла вызывающей стороной
+            self.client = OpenAI(
+                api_key=config.api_key,
+                max_retries=config.max_retries,
+                timeout=httpx.Timeout(config.timeout, connect=10.0)
+            )
+            # Неизменяемые параметры запроса связываем один раз
+            self._create = functools.partial(
+                self.client.audio.transcriptions.create,
+                response_format="text",  # Просим вернуть чистый текст
+                prompt=_MEETING_PROMPT
+            )
+            # Основной сценарий: модель из конфигурации
+            self._default_call = functools.partial(self._create, model=config.transcript_model)
             logger.info("OpenAI клиент успешно инициализирован")
         except AuthenticationError as e:
             logger.error(f"Ошибка аутентификации OpenAI API: {e}")
@@ -31,7 +79,118 @@ class OpenAITranscriber:
             logger.error(f"Общая ошибка инициализации OpenAI клиента: {e}")
             raise
 
-    def transcribe_from_file(self, audio_path: str, model_name: Optional[str] = None) -> str:
+    def _trim_silence(self, audio_path: str) -> Optional[str]:
+        """
+        Вырезание длинных пауз из записи перед загрузкой
+
+        Args:
+            audio_path: Путь к аудиофайлу
+
+        Returns:
+            Optional[str]: Путь к временному файлу только с речью или None, если вырезать нечего
+        """
+        audio = AudioSegment.from_file(audio_path).set_frame_rate(16000).set_channels(1)
+        raw_data = audio.raw_data
+        width = audio.sample_width
+        bytes_per_ms = audio.frame_rate * width // 1000
+        window = _SILENCE_WINDOW_MS * bytes_per_ms
+
+        # Громкость по окнам считается в audioop (C), без нарезки AudioSegment
+        threshold = audio.rms * db_to_float(_SILENCE_THRESH_DB)
+        voiced = [audioop.rms(raw_data[i:i + window], width) > threshold
+                  for i in range(0, len(raw_data), window)]
+
+        # Собираем интервалы речи, склеивая паузы короче минимальной длины
+        min_gap = _SILENCE_MIN_LEN_MS // _SILENCE_WINDOW_MS
+        spans = []
+        for idx, is_voiced in enumerate(voiced):
+            if not is_voiced:
+                continue
+            if spans and idx - spans[-1][1] < min_gap:
+                spans[-1][1] = idx + 1
+            else:
+                spans.append([idx, idx + 1])
+
+        padding = _SILENCE_PADDING_MS * bytes_per_ms
+        speech = b"".join(
+            raw_data[max(0, start * window - padding):end * window + padding]
+            for start, end in spans
+        )
+
+        if not speech or len(speech) >= len(raw_data) * 0.95:
+            logger.info("Существенных пауз не найдено, загружается исходный файл")
+            return None
+
+        logger.info(f"Паузы вырезаны: {len(raw_data) / bytes_per_ms / 1000:.2f} -> "
+                    f"{len(speech) / bytes_per_ms / 1000:.2f} секунд")
+
+        speech_audio = AudioSegment(data=speech, sample_width=width, frame_rate=audio.frame_rate, channels=1)
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp_file:
+            try:
+                speech_audio.export(tmp_file, format="mp3", bitrate="64k")
+            except Exception:
+                # Файл создан с delete=False: при ошибке экспорта удаляем его сами
+                tmp_file.close()
+                os.remove(tmp_file.name)
+                raise
+        return tmp_file.name
+
+    def _upload(self, audio_path: str, call: Callable) -> str:
+        """
+        Отправка одного файла в API транскрипции
+
+        Args:
+            audio_path: Путь к аудиофайлу
+            call: Подготовленный вызов API с выбранной моделью
+
+        Returns:
+            str: Текст транскрипции
+        """
+        with open(audio_path, "rb", buffering=_READ_BUFFER_SIZE) as audio_file:
+            # Подсказка ядру о последовательном чтении (только POSIX)
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(audio_file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+            # Вызов API для транскрипции
+            transcription = call(file=audio_file)
+
+        # OpenAI API возвращает напрямую строку, если response_format="text"
+        return str(transcription)
+
+    def _transcribe_in_chunks(self, audio_path: str, call: Callable) -> str:
+        """
+        Транскрипция записи, превышающей ограничение API, по фрагментам с перекрытием
+
+        Фрагменты загружаются параллельно, текст склеивается с удалением повторов на стыках.
+
+        Args:
+            audio_path: Путь к аудиофайлу
+            call: Подготовленный вызов API с выбранной моделью
+
+        Returns:
+            str: Текст транскрипции
+        """
+        audio = AudioSegment.from_file(audio_path).set_frame_rate(16000).set_channels(1)
+        step = _CHUNK_LENGTH_MS - _CHUNK_OVERLAP_MS
+
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                ThreadPoolExecutor(max_workers=_MAX_PARALLEL_UPLOADS) as executor:
+            futures = []
+            # Загрузка очередного фрагмента начинается сразу после его экспорта; последний
+            # фрагмент начинается до конца перекрытия, иначе он целиком повторял бы предыдущий
+            last_start = max(len(audio) - _CHUNK_OVERLAP_MS, 1)
+            for idx, start in enumerate(range(0, last_start, step)):
+                chunk_path = os.path.join(tmp_dir, f"chunk_{idx:04d}.mp3")
+                audio[start:start + _CHUNK_LENGTH_MS].export(chunk_path, format="mp3", bitrate="64k")
+                futures.append(executor.submit(self._upload, chunk_path, call))
+
+            logger.info(f"Файл {audio_path} разбит на {len(futures)} фрагментов")
+            parts = [future.result() for future in futures]
+
+        return merge_transcripts(parts)
+
+    def transcribe_from_file(self, audio_path: str, model_name: Optional[str] = None,
+                             trim_silence: bool = False) -> str:
         """
         Транскрипция аудио из файла с использованием OpenAI Whisper API
 
@@ -39,26 +198,38 @@ class OpenAITranscriber:
             audio_path: Путь к аудиофайлу (поддерживаются mp3, mp4, m4a, wav, flac, aac, ogg)
             model_name: (Опционально) Имя модели Whisper для использования (например, "whisper-1").
                         Если не указано, используется модель из конфигурации.
+            trim_silence: Вырезать длинные паузы перед загрузкой (меньше данных и секунд API)
 
         Returns:
             str: Текст транскрипции
+
+        Raises:
+            ValueError: Если файл пустой
         """
         logger.info(f"Начало транскрипции аудиофайла: {audio_path} с OpenAI Whisper")
 
-        chosen_model = model_name if model_name else self.config.transcript_model
+        if model_name:
+            call = functools.partial(self._create, model=model_name)
+        else:
+            call = self._default_call
 
+        trimmed_path = None
         try:
-            with open(audio_path, "rb") as audio_file:
-                # Вызов API для транскрипции
-                transcription = self.client.audio.transcriptions.create(
-                    model=chosen_model,
-                    file=audio_file,
-                    response_format="text",
-                    prompt="Представлено совещание о сроках выполнения, задачах и выполняющих в научно-деловом стиле. В данном совещании обрати особое внимание на диалоги между собеседниками, в диалогах указывай, кто говорит, если собеседники представляются."  # Просим вернуть чистый текст
-                )
-
-            # OpenAI API возвращает напрямую строку, если response_format="text"
-            transcript_text = str(transcription)
+            # Проверяем файл локально, чтобы не отправлять заведомо некорректный запрос
+            if os.stat(audio_path).st_size == 0:
+                raise ValueError(f"Аудиофайл пустой: {audio_path}")
+
+            if trim_silence:
+                trimmed_path = self._trim_silence(audio_path)
+            upload_path = trimmed_path or audio_path
+
+            file_size = os.stat(upload_path).st_size
+            if file_size > _WHISPER_MAX_FILE_SIZE:
+                logger.info(f"Файл {audio_path} ({file_size / 1024 / 1024:.1f} МБ) превышает "
+                            f"ограничение API в 25 МБ, транскрипция по фрагментам")
+                transcript_text = self._transcribe_in_chunks(upload_path, call)
+            else:
+                transcript_text = self._upload(upload_path, call)
 
             logger.info(f"Транскрипция завершена для {audio_path}. Длина текста: {len(transcript_text)} символов")
             return transcript_text
@@ -77,4 +248,7 @@ class OpenAITranscriber:
             raise
         except Exception as e:
             logger.error(f"Неизвестная ошибка при транскрипции файла {audio_path}: {e}")
-            raise
\ No newline at end of file
+            raise
+        finally:
+            if trimmed_path:
+                os.remove(trimmed_path)
@@ -1,13 +1,42 @@
+import audioop
 import json
 import logging
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List
 
 import vosk
 from pydub import AudioSegment
 
+from audio_utils import FFMPEG_PATH, SAMPLE_RATE, iter_pcm16k_mono, merge_transcripts
 from config import VoskConfig
 
 logger = logging.getLogger(__name__)
 
+# Перекрытие соседних сегментов: слово на границе целиком попадает хотя бы в один из них
+_SEGMENT_OVERLAP_MS = 1000
+# Примерно столько слов умещается в перекрытие: на стыке сравниваются только они
+_SEGMENT_OVERLAP_WORDS = 4
+
+# Окно оценки громкости при поиске тихих сегментов
+_SILENCE_WINDOW_MS = 100
+
+# Reset() появился не во всех сборках vosk; без него распознаватель пересоздается
+_HAS_RESET = hasattr(vosk.KaldiRecognizer, "Reset")
+
+# Так Vosk сериализует пустой результат (тишина, шум); такие ответы не разбираем
+_EMPTY_RESULT_MARKER = '"text" : ""'
+
+
+def _result_text(result: str) -> str:
+    """Текст из JSON-результата Vosk"""
+    if _EMPTY_RESULT_MARKER in result:
+        return ''
+    return json.loads(result).get('text', '')
+
 
 class VoskTranscriber:
     """Класс для транскрипции аудио с помощью Vosk"""
@@ -20,14 +49,77 @@ class VoskTranscriber:
             config: Конфигурация Vosk
         """
         self.config = config
-        logger.info(f"Загрузка модели Vosk из: {config.model_path}")
 
+        if not config.model_path or not os.path.isdir(config.model_path):
+            logger.error(f"Модель Vosk не найдена: {config.model_path}")
+            raise FileNotFoundError(f"Модель Vosk не найдена: {config.model_path}")
+
+        self.workers = config.workers or os.cpu_count() or 1
+        # Размер сегмента в байтах для 16kHz 16-битного аудио (кратен размеру сэмпла)
+        self._segment_size = config.chunk_size * SAMPLE_RATE // 1000 * 2
+        self._overlap_size = _SEGMENT_OVERLAP_MS * SAMPLE_RATE // 1000 * 2
+        self.model = None
+        self._executor = None
+        self._batch_model = None
+        # Распознаватель потока-обработчика: создается один раз и сбрасывается между сегментами
+        self._local = threading.local()
+        # Порог тишины в единицах RMS 16-битного сэмпла
+        if config.silence_threshold_dbfs is None:
+            self._silence_rms = None
+        else:
+            self._silence_rms = 32768 * 10 ** (config.silence_threshold_dbfs / 20)
+        self._silence_window_size = _SILENCE_WINDOW_MS * SAMPLE_RATE // 1000 * 2
+
+        if config.use_batch:
+            # Пакетное распознавание на GPU (требуется GPU-сборка vosk):
+            # сегменты обрабатываются как параллельные потоки одной модели
+            try:
+                vosk.GpuInit()
+                self._batch_model = vosk.BatchModel(config.model_path)
+                logger.info(f"Пакетная модель Vosk загружена на GPU: {config.model_path}")
+            except Exception as e:
+                logger.error(f"Ошибка загрузки пакетной модели Vosk: {e}")
+                raise
+        else:
+            try:
+                self.model = vosk.Model(config.model_path)
+            except Exception as e:
+                logger.error(f"Ошибка загрузки модели Vosk: {e}")
+                raise
+            # Vosk отпускает GIL на время распознавания, поэтому сегменты декодируются в потоках:
+            # модель загружена один раз и общая, у каждого потока свой распознаватель
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+            logger.info(f"Пул распознавания Vosk: {self.workers} потоков, модель: {config.model_path}")
+
+    def _get_recognizer(self) -> vosk.KaldiRecognizer:
+        """Распознаватель текущего потока (создается при первом обращении)"""
+        recognizer = getattr(self._local, "recognizer", None)
+        if recognizer is None:
+            # Пословные таймкоды не используются, поэтому SetWords не включаем: результат компактнее
+            recognizer = vosk.KaldiRecognizer(self.model, SAMPLE_RATE)
+            self._local.recognizer = recognizer
+        return recognizer
+
+    def _decode_segment(self, pcm: bytes) -> str:
+        """
+        Распознавание независимого сегмента аудио в потоке-обработчике
+
+        Args:
+            pcm: Сегмент 16kHz mono 16-bit PCM
+
+        Returns:
+            str: Текст сегмента
+        """
+        recognizer = self._get_recognizer()
         try:
-            self.model = vosk.Model(config.model_path)
-            logger.info("Модель Vosk успешно загружена")
-        except Exception as e:
-            logger.error(f"Ошибка загрузки модели Vosk: {e}")
-            raise
+            recognizer.AcceptWaveform(pcm)
+            return _result_text(recognizer.FinalResult())
+        finally:
+            # Сброс состояния вместо создания нового распознавателя для следующего сегмента
+            if _HAS_RESET:
+                recognizer.Reset()
+            else:
+                self._local.recognizer = None
 
     def load_and_preprocess_audio(self, audio_path: str) -> AudioSegment:
         """
@@ -42,11 +134,22 @@ class VoskTranscriber:
         logger.info(f"Загрузка аудиофайла: {audio_path}")
 
         try:
-            # Загрузка аудио с поддержкой различных форматов
-            audio = AudioSegment.from_file(audio_path)
+            # Загрузка аудио с поддержкой различных форматов; ffmpeg сразу декодирует
+            # в 16kHz mono, чтобы не передискретизировать весь буфер в pydub
+            audio = AudioSegment.from_file(
+                audio_path,
+                parameters=["-ar", str(SAMPLE_RATE), "-ac", "1"]
+            )
 
-            # Конвертация в нужный формат для Vosk (16kHz, mono, 16-bit PCM)
-            audio = audio.set_frame_rate(16000).set_channels(1).set_sample_width(2)
+            # Конвертация в нужный формат для Vosk (16kHz, mono, 16-bit PCM) на случай,
+            # если файл прочитан без ffmpeg (wav); каждое преобразование копирует весь буфер,
+            # поэтому выполняем только нужные
+            if audio.channels != 1:
+                audio = audio.set_channels(1)
+            if audio.frame_rate != SAMPLE_RATE:
+                audio = audio.set_frame_rate(SAMPLE_RATE)
+            if audio.sample_width != 2:
+                audio = audio.set_sample_width(2)
 
             logger.info(f"Аудио обработано: {len(audio) / 1000:.2f} секунд")
 
@@ -58,35 +161,61 @@ class VoskTranscriber:
 
     def transcribe_audio(self, audio: AudioSegment) -> str:
         """
-        Полная транскрипция аудио по чанкам
+        Полная транскрипция аудио
 
         Args:
-            audio: AudioSegment для транскрипции
+            audio: AudioSegment для транскрипции (16kHz, mono, 16-bit)
 
         Returns:
             str: Полный текст транскрипции
         """
-        logger.info("Начало транскрипции аудио...")
+        return self.transcribe_pcm(audio.raw_data)
 
-        try:
-            # Создаем распознаватель один раз
-            recognizer = vosk.KaldiRecognizer(self.model, 16000)
-            recognizer.SetWords(True)
+    def transcribe_pcm(self, raw_data: bytes) -> str:
+        """
+        Полная транскрипция PCM по независимым сегментам, распознаваемым параллельно
+
+        Args:
+            raw_data: Сырые данные 16kHz mono 16-bit PCM
+
+        Returns:
+            str: Полный текст транскрипции
+        """
+        segment_size = self._segment_size
+        # Срезы memoryview не копируют данные: сегмент копируется один раз, при добавлении перекрытия
+        view = memoryview(raw_data)
+        return self._transcribe_segments(
+            view[i:i + segment_size] for i in range(0, len(view), segment_size)
+        )
+
+    def _transcribe_segments(self, segments: Iterable[bytes]) -> str:
+        """
+        Распознавание потока сегментов PCM в пуле потоков
+
+        Число сегментов в обработке ограничено, поэтому при потоковом чтении
+        в памяти не накапливается весь файл.
+
+        Args:
+            segments: Сегменты 16kHz mono 16-bit PCM в порядке следования
 
-            # Получаем сырые данные аудио
-            raw_data = audio.raw_data
+        Returns:
+            str: Полный текст транскрипции
+        """
+        logger.info("Начало транскрипции аудио...")
 
-            # Размер чанка: 5 секунд для 16kHz 16-битного аудио (5 * 16000 сэмплов * 2 байта)
-            chunk_size = 5 * 16000 * 2  # 160,000 байт
+        segments = self._with_overlap(segments)
+        if self._silence_rms is not None:
+            # Тишина не дает текста, а Kaldi прогоняет по ней всю акустическую модель
+            segments = (segment for segment in segments if not self._is_silent(segment))
 
-            # Обрабатываем аудио по чанкам
-            for i in range(0, len(raw_data), chunk_size):
-                chunk = raw_data[i:i + chunk_size]
-                recognizer.AcceptWaveform(chunk)
+        try:
+            if self._batch_model:
+                texts = self._decode_batched(segments)
+            else:
+                texts = self._decode_pooled(segments)
 
-            # Получаем финальный результат
-            final_result = json.loads(recognizer.FinalResult())
-            transcript = final_result.get('text', '')
+            # Повторы слов на перекрытиях соседних сегментов удаляются при склейке
+            transcript = merge_transcripts(texts, window_words=_SEGMENT_OVERLAP_WORDS)
 
             logger.info(f"Транскрипция завершена. Длина текста: {len(transcript)} символов")
 
@@ -96,6 +225,82 @@ class VoskTranscriber:
             logger.error(f"Ошибка при транскрипции: {e}")
             raise
 
+    def _with_overlap(self, segments: Iterable[bytes]) -> Iterator[bytes]:
+        """Добавление к каждому сегменту конца предыдущего, чтобы не терять контекст на границах"""
+        tail = b""
+        for segment in segments:
+            # join принимает и bytes, и memoryview; результат — готовый для Vosk bytes
+            yield b"".join((tail, segment))
+            tail = segment[-self._overlap_size:]
+
+    def _is_silent(self, segment: bytes) -> bool:
+        """
+        Проверка, что сегмент целиком тише порога
+
+        Средняя громкость всего сегмента не подходит: короткая тихая фраза в длинной паузе
+        усредняется ниже порога. Поэтому порог сравнивается с громкостью каждого окна
+        в _SILENCE_WINDOW_MS; громкость считается в audioop (C).
+
+        Args:
+            segment: Сегмент 16kHz mono 16-bit PCM
+
+        Returns:
+            bool: True, если ни одно окно не громче порога
+        """
+        # Пик ниже порога — ни одно окно не может быть громче, окна не проверяем
+        if audioop.max(segment, 2) >= self._silence_rms:
+            window = self._silence_window_size
+            for start in range(0, len(segment), window):
+                if audioop.rms(segment[start:start + window], 2) >= self._silence_rms:
+                    return False
+
+        logger.debug("Пропущен тихий сегмент")
+        return True
+
+    def _decode_pooled(self, segments: Iterable[bytes]) -> List[str]:
+        """Распознавание сегментов в пуле потоков с ограничением числа сегментов в обработке"""
+        max_pending = 2 * self.workers
+        pending = deque()
+        texts = []
+
+        for segment in segments:
+            pending.append(self._executor.submit(self._decode_segment, segment))
+            if len(pending) >= max_pending:
+                texts.append(pending.popleft().result())
+        texts.extend(future.result() for future in pending)
+
+        return texts
+
+    def _decode_batched(self, segments: Iterable[bytes]) -> List[str]:
+        """Распознавание сегментов пакетами на GPU: один BatchRecognizer на сегмент"""
+        segments = iter(segments)
+        texts = []
+
+        while True:
+            wave = list(islice(segments, self.workers))
+            if not wave:
+                break
+
+            recognizers = []
+            for segment in wave:
+                recognizer = vosk.BatchRecognizer(self._batch_model, SAMPLE_RATE)
+                recognizer.AcceptWaveform(segment)
+                recognizer.FinishStream()
+                recognizers.append(recognizer)
+
+            # Ожидаем обработки всех потоков пакета и забираем результаты в исходном порядке
+            self._batch_model.Wait()
+            for recognizer in recognizers:
+                parts = []
+                while True:
+                    result = recognizer.Result()
+                    if not result:
+                        break
+                    parts.append(_result_text(result))
+                texts.append(" ".join(part for part in parts if part))
+
+        return texts
+
     def transcribe_from_file(self, audio_path: str) -> str:
         """
         Транскрипция аудио из файла
@@ -106,5 +311,13 @@ class VoskTranscriber:
         Returns:
             str: Текст транскрипции
         """
+        # ffmpeg отдает PCM в нужном формате потоком, сегменты распознаются по мере чтения;
+        # pydub остается запасным вариантом, если ffmpeg не установлен
+        if FFMPEG_PATH:
+            logger.info(f"Потоковое декодирование аудиофайла через ffmpeg: {audio_path}")
+            return self._transcribe_segments(
+                iter_pcm16k_mono(audio_path, self._segment_size, self.config.resampler)
+            )
+
         audio = self.load_and_preprocess_audio(audio_path)
         return self.transcribe_audio(audio)
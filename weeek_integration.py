@@ -1,24 +1,174 @@
+import json
 import logging
 import os
+import re
+import threading
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 import requests
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+from typing import Dict, List, Any, Optional, Tuple
+from datetime import date, datetime, timedelta
 from config import WeeekConfig
 from openai_analyzer import MeetingAnalysis
 
 logger = logging.getLogger(__name__)
 
+# Временные ошибки API, после которых запрос можно повторить
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Методы, которые безопасно повторять при ошибке сервера (POST мог успеть создать задачу)
+_IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+_MAX_RETRY_AFTER = 60
+
+# Поддерживаемые методы; тело запроса передается только для методов из _BODY_METHODS
+_SUPPORTED_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE"})
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+# Таймауты запроса (подключение, чтение), с; без них зависший запрос блокирует обработку совещания
+_REQUEST_TIMEOUT = (5, 30)
+
+# Поля участника, которые нужны для поиска исполнителя; остальное в кэше не храним
+_MEMBER_FIELDS = ("id", "email", "firstName", "lastName")
+
+# Время жизни кэша участников и проектов, с: бот работает долго, а состав команды меняется
+_CACHE_TTL = 600
+
+# Число одновременных запросов при создании задач
+_MAX_PARALLEL_REQUESTS = 8
+
+# Шаблон описания задачи из анализа
+_TASK_DESCRIPTION_TEMPLATE = """📋 {summary}
+
+📝 Подробное описание:
+{description}
+
+👤 Ответственный: {assignee}
+📅 Срок: {due_date}
+
+---
+🤖 Автоматически извлечено из транскрипции совещания"""
+
+# Абсолютные даты в ответах модели: YYYY-MM-DD, DD.MM.YYYY или DD/MM/YYYY
+_DUE_DATE_RE = re.compile(
+    r"(?P<y>\d{4})-(?P<m>\d{1,2})-(?P<d>\d{1,2})"
+    r"|(?P<d2>\d{1,2})[./](?P<m2>\d{1,2})[./](?P<y2>\d{4})"
+)
+
+# Относительные сроки (в днях от текущей даты); длинные фразы раньше коротких,
+# чтобы "послезавтра" не распознавалось как "завтра"
+_RELATIVE_DUE_DATES = {
+    "послезавтра": 2,
+    "завтра": 1,
+    "через неделю": 7,
+    "через две недели": 14,
+    "через месяц": 30
+}
+_RELATIVE_DUE_DATE_RE = re.compile("|".join(map(re.escape, _RELATIVE_DUE_DATES)))
+
+_backoff = wait_exponential_jitter(initial=1, max=_MAX_RETRY_AFTER)
+
+
+def _is_connect_refused(exception: BaseException) -> bool:
+    """Ошибка установки соединения (отказ, DNS): requests оборачивает ее в ConnectionError"""
+    if not isinstance(exception, requests.exceptions.ConnectionError) or not exception.args:
+        return False
+    return isinstance(getattr(exception.args[0], "reason", None), NewConnectionError)
+
+
+def _is_retryable(exception: BaseException) -> bool:
+    """Проверка, стоит ли повторять запрос после ошибки"""
+    if isinstance(exception, requests.exceptions.ConnectTimeout) or _is_connect_refused(exception):
+        # Соединение не установлено — запрос не отправлен, повтор безопасен для любого метода
+        return True
+    if isinstance(exception, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+        # Обрыв после отправки: POST мог успеть создать задачу, повторяем только идемпотентные методы
+        request = getattr(exception, "request", None)
+        return request is None or request.method in _IDEMPOTENT_METHODS
+
+    response = getattr(exception, "response", None)
+    if not isinstance(exception, requests.exceptions.HTTPError) or response is None:
+        return False
+
+    if response.status_code == 429:
+        return True
+    return response.status_code in _RETRY_STATUSES and response.request.method in _IDEMPOTENT_METHODS
+
+
+def _wait_retry_after(retry_state) -> float:
+    """Задержка перед повтором: заголовок Retry-After, иначе экспоненциальная с джиттером"""
+    response = getattr(retry_state.outcome.exception(), "response", None)
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), _MAX_RETRY_AFTER)
+    return _backoff(retry_state)
+
+
+def _normalize_name(name: str) -> str:
+    """
+    Ключ для поиска участника: NFKC, casefold, ё -> е и схлопнутые пробелы
+
+    Имена приходят из транскрипции и могут отличаться от профиля Weeek
+    регистром, формой записи символов, буквой "ё" и лишними пробелами.
+    """
+    return " ".join(unicodedata.normalize("NFKC", name).casefold().replace("ё", "е").split())
+
+
+@lru_cache(maxsize=256)
+def _parse_due_date(date_string: str, today: date) -> Optional[str]:
+    """
+    Разбор срока задачи; результат кэшируется, т.к. у задач совещания сроки часто совпадают
+
+    Args:
+        date_string: Строка с датой
+        today: Текущая дата (входит в ключ кэша: от нее зависят относительные сроки)
+
+    Returns:
+        Optional[str]: Дата в формате YYYY-MM-DD или None
+    """
+    text = date_string.strip().lower()
+
+    # Одно регулярное выражение вместо перебора форматов strptime с исключениями
+    match = _DUE_DATE_RE.fullmatch(text)
+    if match:
+        year, month, day = match.group("y", "m", "d") if match.group("y") else match.group("y2", "m2", "d2")
+        try:
+            return date(int(year), int(month), int(day)).isoformat()
+        except ValueError:
+            pass  # Несуществующая дата, например 31.02.2025
+
+    days = _RELATIVE_DUE_DATES.get(text)
+    if days is None:
+        match = _RELATIVE_DUE_DATE_RE.search(text)
+        if match:
+            days = _RELATIVE_DUE_DATES[match.group()]
+    if days is not None:
+        return (today + timedelta(days=days)).isoformat()
+
+    logger.warning(f"Не удалось распарсить дату: {date_string}")
+    return None
+
+
+def _log_retry(retry_state) -> None:
+    logger.warning(f"Повтор запроса к Weeek (попытка {retry_state.attempt_number + 1}) "
+                   f"после ошибки: {retry_state.outcome.exception()}")
+
 
 class WeeekIntegration:
     """Класс для интеграции с Weeek API v1"""
 
-    def __init__(self, config: WeeekConfig):
+    def __init__(self, config: WeeekConfig, validate_on_init: bool = True):
         """
         Инициализация интеграции с Weeek
 
         Args:
             config: Конфигурация Weeek
+            validate_on_init: Проверить подключение и загрузить проект и участников сразу;
+                              если False — подключение проверяется при первом запросе
         """
         self.config = config
         self.base_url = "https://api.weeek.net/public/v1"
@@ -27,18 +177,68 @@ class WeeekIntegration:
             "Content-Type": "application/json"
         }
 
+        # Одна сессия на все запросы: соединение с API переиспользуется (keep-alive)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # Пул соединений рассчитан на параллельное создание задач. Адаптер сам запросы не повторяет:
+        # все повторы (подключение, обрывы, 429/5xx) выполняет _make_request в одном месте,
+        # с учетом Retry-After и идемпотентности метода
+        self.session.mount(self.base_url, HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=2 * _MAX_PARALLEL_REQUESTS
+        ))
+
+        # Участники workspace и проекты почти не меняются: загружаем их один раз
+        self._members_lock = threading.Lock()
+        self._member_index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._member_index_time = 0.0
+        # ID проекта -> (данные проекта, время загрузки)
+        self._projects: Dict[str, Tuple[Dict[str, Any], float]] = {}
+        self.board_id = os.getenv("WEEEK_BOARD_ID")
+
+        self._validated = False
+        self._validation_lock = threading.Lock()
+        if not validate_on_init:
+            return
+
         # Проверка подключения
-        try:
-            self._check_connection()
-            logger.info(f"Успешное подключение к Weeek API")
-        except Exception as e:
-            logger.error(f"Ошибка подключения к Weeek: {e}")
-            raise
+        self._ensure_validated()
+
+        # Проект и участники нужны при обработке каждого совещания: загружаем их заранее,
+        # чтобы не тратить на это запросы во время обработки
+        if config.project_id and not self.get_project_by_id(config.project_id):
+            logger.warning(f"Проект {config.project_id} недоступен при инициализации")
+        self._get_member_index()
+
+    def close(self) -> None:
+        """Закрытие сессии и соединений с API"""
+        self.session.close()
+
+    def __enter__(self) -> "WeeekIntegration":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _ensure_validated(self) -> None:
+        """Однократная проверка подключения; потокобезопасна, т.к. задачи создаются параллельно"""
+        if self._validated:
+            return
+        with self._validation_lock:
+            if self._validated:
+                return
+            try:
+                self._check_connection()
+                logger.info(f"Успешное подключение к Weeek API")
+            except Exception as e:
+                logger.error(f"Ошибка подключения к Weeek: {e}")
+                raise
+            self._validated = True
 
     def _check_connection(self):
         """Проверка подключения к API"""
         url = f"{self.base_url}/user/me"
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url, timeout=_REQUEST_TIMEOUT)
 
         if response.status_code != 200:
             raise Exception(f"Ошибка подключения к Weeek API: {response.status_code} - {response.text}")
@@ -46,6 +246,13 @@ class WeeekIntegration:
         user_data = response.json()
         logger.info(f"Подключен пользователь: {user_data.get('user', {}).get('firstName', 'Неизвестно')}")
 
+    @retry(
+        retry=retry_if_exception(_is_retryable),
+        wait=_wait_retry_after,
+        stop=stop_after_attempt(6),
+        before_sleep=_log_retry,
+        reraise=True
+    )
     def _make_request(self, method: str, endpoint: str, data: Dict = None, params: Dict = None) -> Dict[str, Any]:
         """
         Выполнение запроса к API
@@ -59,23 +266,25 @@ class WeeekIntegration:
         Returns:
             Dict: Ответ API
         """
+        self._ensure_validated()
+
         url = f"{self.base_url}/{endpoint}"
+        method = method.upper()
+        if method not in _SUPPORTED_METHODS:
+            raise ValueError(f"Неподдерживаемый HTTP метод: {method}")
 
-        try:
-            if method.upper() == "GET":
-                response = requests.get(url, headers=self.headers, params=params)
-            elif method.upper() == "POST":
-                response = requests.post(url, headers=self.headers, json=data)
-            elif method.upper() == "PUT":
-                response = requests.put(url, headers=self.headers, json=data)
-            elif method.upper() == "PATCH":
-                response = requests.patch(url, headers=self.headers, json=data)
-            elif method.upper() == "DELETE":
-                response = requests.delete(url, headers=self.headers)
-            else:
-                raise ValueError(f"Неподдерживаемый HTTP метод: {method}")
+        body = None
+        if method in _BODY_METHODS and data is not None:
+            # Кириллица и эмодзи в описаниях передаются как UTF-8, а не \uXXXX-экранированием
+            # (по умолчанию в requests): тело запроса в 2-3 раза меньше
+            body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
+        try:
+            response = self.session.request(method, url, params=params, data=body, timeout=_REQUEST_TIMEOUT)
             response.raise_for_status()
+            # Пустой ответ (например, 204 No Content) не разбираем: json() на нем падает
+            if not response.content:
+                return {}
             return response.json()
 
         except requests.exceptions.RequestException as e:
@@ -111,9 +320,15 @@ class WeeekIntegration:
         Returns:
             Optional[Dict]: Данные проекта
         """
+        cached = self._projects.get(project_id)
+        if cached and time.monotonic() - cached[1] < _CACHE_TTL:
+            return cached[0]
+
         try:
             response = self._make_request("GET", f"tm/projects/{project_id}")
-            return response.get("project", {})
+            project = response.get("project", {})
+            self._projects[project_id] = (project, time.monotonic())
+            return project
         except Exception as e:
             logger.error(f"Ошибка получения проекта {project_id}: {e}")
             return None
@@ -177,26 +392,47 @@ class WeeekIntegration:
         Returns:
             Optional[Dict]: Данные пользователя
         """
-        members = self.get_workspace_members()
-
-        name_lower = name.lower()
-        for member in members:
-            # Поиск по email
-            if member.get("email", "").lower() == name_lower:
-                return member
+        member = self._get_member_index().get(_normalize_name(name))
+        if member is None:
+            logger.warning(f"Пользователь '{name}' не найден")
+        return member
 
-            # Поиск по имени
-            first_name = member.get("firstName", "").lower()
-            last_name = member.get("lastName", "").lower()
-            full_name = f"{first_name} {last_name}".strip()
+    def _get_member_index(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Индекс участников workspace по email, имени, фамилии и полному имени
 
-            if (first_name == name_lower or
-                    last_name == name_lower or
-                    full_name == name_lower):
-                return member
+        Список участников запрашивается не чаще раза в _CACHE_TTL секунд; задачи
+        создаются параллельно, поэтому построение индекса защищено блокировкой.
 
-        logger.warning(f"Пользователь '{name}' не найден")
-        return None
+        Returns:
+            Dict: Нормализованный ключ -> данные участника
+        """
+        with self._members_lock:
+            if self._member_index is not None and time.monotonic() - self._member_index_time < _CACHE_TTL:
+                return self._member_index
+
+            index = {}
+            members = self.get_workspace_members()
+            for member in members:
+                member = {field: member.get(field) for field in _MEMBER_FIELDS}
+                first_name = _normalize_name(member.get("firstName") or "")
+                last_name = _normalize_name(member.get("lastName") or "")
+                keys = (
+                    _normalize_name(member.get("email") or ""),
+                    first_name,
+                    last_name,
+                    f"{first_name} {last_name}".strip()
+                )
+                # При совпадении ключей остается первый участник, как при прежнем поиске перебором
+                for key in keys:
+                    if key:
+                        index.setdefault(key, member)
+
+            # Пустой список может означать ошибку запроса — в этом случае не кэшируем
+            if members:
+                self._member_index = index
+                self._member_index_time = time.monotonic()
+            return index
 
     def parse_due_date(self, date_string: str) -> Optional[str]:
         """
@@ -211,32 +447,7 @@ class WeeekIntegration:
         if not date_string or date_string == "Не указан":
             return None
 
-        # Попытка парсинга различных форматов
-        formats = ['%Y-%m-%d', '%d.%m.%Y', '%d/%m/%Y']
-
-        for fmt in formats:
-            try:
-                parsed_date = datetime.strptime(date_string, fmt)
-                return parsed_date.strftime('%Y-%m-%d')
-            except ValueError:
-                continue
-
-        # Если дата в относительном формате
-        relative_dates = {
-            "завтра": 1,
-            "послезавтра": 2,
-            "через неделю": 7,
-            "через две недели": 14,
-            "через месяц": 30
-        }
-
-        for phrase, days in relative_dates.items():
-            if phrase in date_string.lower():
-                future_date = datetime.now() + timedelta(days=days)
-                return future_date.strftime('%Y-%m-%d')
-
-        logger.warning(f"Не удалось распарсить дату: {date_string}")
-        return None
+        return _parse_due_date(date_string, date.today())
 
     def create_task(self,
                     title: str,
@@ -283,39 +494,59 @@ class WeeekIntegration:
             raise
 
 
-    def create_summary_task(self, analysis: MeetingAnalysis, board_id: str) -> Dict[str, Any]:
+    def create_summary_task(self,
+                            analysis: MeetingAnalysis,
+                            board_id: str,
+                            now: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Создание сводной задачи с результатами совещания
 
         Args:
             analysis: Анализ совещания
             board_id: ID доски
+            now: Момент обработки совещания (по умолчанию текущее время)
 
         Returns:
             Dict: Данные созданной задачи
         """
-        title = f"📋 Сводка совещания от {datetime.now().date()}"
-
-        description = f"""Результаты совещания
-
-👥 Председатель: {analysis.president if analysis.president else "Не определен"}\n
-
-👥 Секретарь: {analysis.secretary if analysis.secretary else "Не определен"}\n\n
-
-📝 Резюме {analysis.summary}\n\n
-
-✅ Принятые решения ({len(analysis.decisions)})
-{chr(10).join([f'• {decision}' for decision in analysis.decisions]) if analysis.decisions else 'Решения не принимались'}\n\n
-
-🔬 Гипотезы для проверки ({len(analysis.hypotheses)})
-{chr(10).join([f'• {hyp["hypothesis"]} - {hyp.get("status", "требует проверки")}' for hyp in analysis.hypotheses]) if analysis.hypotheses else 'Гипотезы не выдвигались'}\n\n
-
-👥 Участники
-{', '.join(analysis.participants) if analysis.participants else 'Не определены'}\n\n
-
-🤖 Автоматически создано на основе анализа транскрипции
-
-📅 Дата создания: {datetime.now().strftime('%d.%m.%Y в %H:%M')}"""
+        now = now or datetime.now()
+        title = f"📋 Сводка совещания от {now.date()}"
+
+        # Описание собирается из строк одним join, без промежуточных списков
+        parts = [
+            "Результаты совещания",
+            "",
+            f"👥 Председатель: {analysis.president or 'Не определен'}",
+            "",
+            "",
+            f"👥 Секретарь: {analysis.secretary or 'Не определен'}",
+            "", "", "",
+            f"📝 Резюме {analysis.summary}",
+            "", "", "",
+            f"✅ Принятые решения ({len(analysis.decisions)})"
+        ]
+        if analysis.decisions:
+            parts.extend(f"• {decision}" for decision in analysis.decisions)
+        else:
+            parts.append("Решения не принимались")
+
+        parts += ["", "", "", f"🔬 Гипотезы для проверки ({len(analysis.hypotheses)})"]
+        if analysis.hypotheses:
+            parts.extend(f"• {hyp['hypothesis']} - {hyp.get('status', 'требует проверки')}"
+                         for hyp in analysis.hypotheses)
+        else:
+            parts.append("Гипотезы не выдвигались")
+
+        parts += [
+            "", "", "",
+            "👥 Участники",
+            ", ".join(analysis.participants) if analysis.participants else "Не определены",
+            "", "", "",
+            "🤖 Автоматически создано на основе анализа транскрипции",
+            "",
+            f"📅 Дата создания: {now.strftime('%d.%m.%Y в %H:%M')}"
+        ]
+        description = "\n".join(parts)
 
         try:
             return self.create_task(
@@ -327,19 +558,91 @@ class WeeekIntegration:
             logger.error(f"Ошибка создания сводной задачи: {e}")
             raise
 
-    def create_tasks_from_analysis(self, analysis: MeetingAnalysis) -> Dict[str, Any]:
+    def _create_one_task(self,
+                         index: int,
+                         task_data: Dict[str, Any],
+                         board_id: str,
+                         main_task_id: int,
+                         assignee_ids: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Создание одной задачи из анализа как подзадачи сводной задачи
+
+        Args:
+            index: Порядковый номер задачи (с нуля)
+            task_data: Данные задачи из анализа
+            board_id: ID доски
+            main_task_id: ID сводной задачи
+            assignee_ids: Имя исполнителя -> ID пользователя Weeek (найденные заранее)
+
+        Returns:
+            Dict: Краткие сведения о созданной задаче
+        """
+        assignee_name = task_data.get('кто_выполняет')
+        assignee_id = assignee_ids.get(assignee_name)
+        assignees = [assignee_id] if assignee_id else []
+
+        # Создание задачи
+        task = self.create_task(
+            title=task_data.get('название', f'Задача {index + 1}'),
+            description=_TASK_DESCRIPTION_TEMPLATE.format(
+                summary=task_data.get('суть_задачи', 'Суть не указана'),
+                description=task_data.get('описание', 'Описание не предоставлено'),
+                assignee=task_data.get('кто_выполняет', 'Не назначен'),
+                due_date=task_data.get('срок', 'Не указан')
+            ),
+            board_id=board_id,
+            assignees=assignees if assignees else None,
+            due_date=task_data.get('срок'),
+            parent_id=main_task_id
+        )
+
+        logger.info(f"Создана задача: {task_data.get('название')}")
+
+        return {
+            "id": task.get("id"),
+            "title": task.get("title"),
+            "type": "task",
+            "assignee": assignee_name,
+            "parent_id": main_task_id
+        }
+
+    def _resolve_assignees(self, tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Поиск исполнителей задач: один раз на каждое уникальное имя
+
+        Args:
+            tasks: Задачи из анализа
+
+        Returns:
+            Dict: Имя исполнителя -> ID пользователя Weeek (только найденные)
+        """
+        assignee_names = {task_data.get('кто_выполняет') for task_data in tasks} - {None, "", "Не назначен"}
+        assignee_ids = {}
+        for name in assignee_names:
+            user = self.find_user_by_name(name)
+            if user:
+                assignee_ids[name] = user.get("id")
+        return assignee_ids
+
+    def create_tasks_from_analysis(self,
+                                   analysis: MeetingAnalysis,
+                                   now: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Создание задач в Weeek на основе анализа
 
         Args:
             analysis: Анализ совещания
-            project_id: ID проекта (если None, создается новый)
+            now: Момент обработки совещания; одна метка времени для всех артефактов
+                 (по умолчанию текущее время)
 
         Returns:
             Dict: Результат создания задач
         """
         logger.info("Создание задач в Weeek...")
 
+        now = now or datetime.now()
+        created_at = now.isoformat()
+
         project_id = self.config.project_id
 
         # Проверка проекта
@@ -347,68 +650,47 @@ class WeeekIntegration:
         if not project:
             raise ValueError(f"Проект {project_id} не найден")
 
-        board_id = os.getenv("WEEEK_BOARD_ID")
+        board_id = self.board_id
 
         created_tasks = []
         failed_tasks = []
 
         try:
-            # Создание сводной задачи
-            summary_task = self.create_summary_task(analysis, board_id)
-            main_task_id = summary_task.get("id")
-            created_tasks.append({
-                "id": main_task_id,
-                "title": summary_task.get("title"),
-                "type": "summary"
-            })
-
-            # Создание задач из анализа
-            for i, task_data in enumerate(analysis.tasks):
-                try:
-                    # Поиск исполнителей
-                    assignees = []
-                    assignee_name = task_data.get('кто_выполняет')
-                    if assignee_name and assignee_name != "Не назначен":
-                        user = self.find_user_by_name(assignee_name)
-                        if user:
-                            assignees.append(user.get("id"))
-
-                    # Создание задачи
-                    task = self.create_task(
-                        title=task_data.get('название', f'Задача {i + 1}'),
-                        description=f"""📋 {task_data.get('суть_задачи', 'Суть не указана')}
-
-📝 Подробное описание:
-{task_data.get('описание', 'Описание не предоставлено')}
-
-👤 Ответственный: {task_data.get('кто_выполняет', 'Не назначен')}
-📅 Срок: {task_data.get('срок', 'Не указан')}
-
----
-🤖 Автоматически извлечено из транскрипции совещания""",
-                        board_id=board_id,
-                        assignees=assignees if assignees else None,
-                        due_date=task_data.get('срок'),
-                        parent_id=main_task_id
-                    )
-
-                    created_tasks.append({
-                        "id": task.get("id"),
-                        "title": task.get("title"),
-                        "type": "task",
-                        "assignee": assignee_name,
-                        "parent_id": main_task_id
-                    })
-
-                    logger.info(f"Создана задача: {task_data.get('название')}")
-
-                except Exception as e:
-                    logger.error(f"Не удалось создать задачу {i + 1}: {e}")
-                    failed_tasks.append({
-                        "index": i + 1,
-                        "title": task_data.get('название', f'Задача {i + 1}'),
-                        "error": str(e)
-                    })
+            # Подзадачам нужен ID сводной задачи, поэтому она создается первой. Исполнители
+            # ищутся одновременно с ее созданием: если кэш участников устарел, его загрузка
+            # не добавляет еще один запрос на критическом пути
+            workers = min(_MAX_PARALLEL_REQUESTS, max(len(analysis.tasks), 1))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                assignees_future = executor.submit(self._resolve_assignees, analysis.tasks)
+
+                summary_task = self.create_summary_task(analysis, board_id, now)
+                main_task_id = summary_task.get("id")
+                created_tasks.append({
+                    "id": main_task_id,
+                    "title": summary_task.get("title"),
+                    "type": "summary"
+                })
+                assignee_ids = assignees_future.result()
+
+                # Задачи независимы друг от друга: создаем их параллельно поверх общей сессии,
+                # потоков не больше, чем задач
+                if analysis.tasks:
+                    futures = [
+                        executor.submit(self._create_one_task, i, task_data, board_id, main_task_id, assignee_ids)
+                        for i, task_data in enumerate(analysis.tasks)
+                    ]
+
+                    # Результаты собираем в исходном порядке задач
+                    for i, (task_data, future) in enumerate(zip(analysis.tasks, futures)):
+                        try:
+                            created_tasks.append(future.result())
+                        except Exception as e:
+                            logger.error(f"Не удалось создать задачу {i + 1}: {e}")
+                            failed_tasks.append({
+                                "index": i + 1,
+                                "title": task_data.get('название', f'Задача {i + 1}'),
+                                "error": str(e)
+                            })
 
             # Формирование результата
             result = {
@@ -422,10 +704,10 @@ class WeeekIntegration:
                 },
                 "tasks": created_tasks,
                 "failed_tasks": failed_tasks,
-                "created_at": datetime.now().isoformat(),
+                "created_at": created_at,
                 "stats": {
                     "total_tasks": len(analysis.tasks),
-                    "created_tasks": len([t for t in created_tasks if t["type"] == "task"]),
+                    "created_tasks": sum(1 for t in created_tasks if t["type"] == "task"),
                     "failed_tasks": len(failed_tasks),
                     "summary_task": 1,
                     "participants": len(analysis.participants),
@@ -443,7 +725,7 @@ class WeeekIntegration:
                 "status": "error",
                 "message": str(e),
                 "project_id": project_id,
-                "created_at": datetime.now().isoformat(),
+                "created_at": created_at,
                 "partial_results": {
                     "created_tasks": created_tasks,
                     "failed_tasks": failed_tasks